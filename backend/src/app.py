@@ -10,28 +10,45 @@ TP 3: Will introduce PostgreSQL database (see migration guide)
 from typing import List, Optional, Dict
 from datetime import datetime, timezone
 from enum import Enum
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+import orjson
+import base64
+import binascii
+import hashlib
 import logging
+import time
+from urllib.parse import urlencode
 
+import asyncio
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 import uuid
 from fastapi import Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy import bindparam, insert, lambda_stmt, select, tuple_, update, func, text
 
+from . import database
 from .database import get_db, init_db
-from .models import TaskModel, TaskStatus, TaskPriority
+from .models import OPEN_TASK_CRITERION, TaskModel, TaskStatus, TaskPriority
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend, Value
+from fastapi_cache.coder import PickleCoder
+from fastapi_cache.decorator import cache
 import os
 
 
 
 # Configure logging
+# Messages au format %-style : le formatage n'a lieu que si le niveau est actif
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True,
 )
 logger = logging.getLogger("taskflow")
 
@@ -40,6 +57,17 @@ logger = logging.getLogger("taskflow")
 # ENUMS & MODELS
 # =============================================================================
 
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convertit une date avec fuseau en UTC naïf.
+
+    La colonne due_date est un TIMESTAMP WITHOUT TIME ZONE : asyncpg refuse
+    d'y écrire une date avec fuseau (ex. "2025-01-01T00:00:00Z").
+    """
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 class TaskCreate(BaseModel):
     """Model for creating a new task."""
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
@@ -49,6 +77,8 @@ class TaskCreate(BaseModel):
     assignee: Optional[str] = Field(None, max_length=100, description="Assigned user")
     due_date: Optional[datetime] = Field(None, description="Due date")
 
+    _due_date_utc = field_validator("due_date")(to_naive_utc)
+
 
 class TaskUpdate(BaseModel):
     """Model for updating a task - all fields optional for partial updates."""
@@ -59,6 +89,8 @@ class TaskUpdate(BaseModel):
     assignee: Optional[str] = Field(None, max_length=100)
     due_date: Optional[datetime] = None
 
+    _due_date_utc = field_validator("due_date")(to_naive_utc)
+
 
 class Task(BaseModel):
     """Model for task response."""
@@ -72,8 +104,23 @@ class Task(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True  # Permet la conversion depuis SQLAlchemy
+    # from_attributes : conversion depuis SQLAlchemy
+    # use_enum_values : stocke directement la valeur str des enums (sérialisation directe)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+
+# Adaptateurs construits une seule fois (schéma compilé au chargement du module)
+_TASK_ADAPTER = TypeAdapter(Task)
+_TASK_LIST_ADAPTER = TypeAdapter(List[Task])
+
+
+def dump_task(task) -> dict:
+    """Sérialise une tâche SQLAlchemy en dict JSON (validation puis dump Pydantic).
+
+    Même travail que la validation response_model de FastAPI, avec un
+    TypeAdapter construit une seule fois au chargement du module.
+    """
+    return _TASK_ADAPTER.dump_python(_TASK_ADAPTER.validate_python(task, from_attributes=True), mode="json")
 
 
 # =============================================================================
@@ -90,9 +137,11 @@ class Task(BaseModel):
 async def lifespan(app: FastAPI):
     """Lifecycle manager - initialise la DB au démarrage."""
     logger.info("🚀 TaskFlow backend starting up...")
-    init_db()  # Crée les tables
+    await init_db()  # Crée les tables
     logger.info("✅ Database initialized")
+    FastAPICache.init(BoundedMemoryBackend(CACHE_MAX_ENTRIES))  # Cache des lectures /tasks
     yield
+    await invalidate_tasks_cache()
     logger.info("🛑 TaskFlow backend shutting down...")
 
 
@@ -103,26 +152,120 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,  # ← Ajouter cette ligne
+    default_response_class=ORJSONResponse,  # Sérialisation JSON via orjson
 )
 
 # Configuration CORS pour le frontend
 cors_origins_str = os.getenv("CORS_ORIGINS", "http://localhost:5173,http://localhost:3000")
-cors_origins = [origin.strip() for origin in cors_origins_str.split(",")]
+cors_origins = tuple(o.strip() for o in cors_origins_str.split(",") if o.strip())
 
+# Méthodes et en-têtes explicites : pas de wildcard à renvoyer à chaque preflight
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
+    allow_headers=("Content-Type", "Authorization"),
+    expose_headers=("X-Next-Cursor",),
 )
 
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# Durées de vie (secondes) des réponses mises en cache
+TASKS_LIST_CACHE_EXPIRE = 5
+TASK_CACHE_EXPIRE = 30
+
+# Nombre maximal d'entrées gardées en mémoire (les moins récemment lues sortent)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1000"))
+
+
+class BoundedMemoryBackend(InMemoryBackend):
+    """Cache en mémoire du processus, borné en nombre d'entrées (LRU).
+
+    InMemoryBackend ne supprime une entrée expirée que lorsqu'elle est relue :
+    les valeurs libres d'assignee feraient grossir le cache sans limite.
+    """
+
+    def __init__(self, max_entries: int):
+        # Stockage propre à l'instance (celui d'InMemoryBackend est partagé par la classe)
+        self._store: OrderedDict[str, Value] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self.max_entries = max_entries
+
+    def _get(self, key: str) -> Optional[Value]:
+        value = super()._get(key)
+        if value is not None:
+            self._store.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        async with self._lock:
+            self._store[key] = Value(value, self._now + (expire or 0))
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+
+
+# Paramètres de GET /tasks qui composent la clé de cache
+TASKS_LIST_CACHE_PARAMS = ("status", "priority", "assignee", "open_only", "limit", "cursor")
+
+
+def tasks_cache_key(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """Clé de cache construite depuis les paramètres validés de GET /tasks.
+
+    Seuls les paramètres connus sont pris en compte (un paramètre inconnu ne
+    crée pas de nouvelle entrée) et leurs valeurs sont encodées : impossible
+    de fabriquer une clé qui collisionne avec une autre requête. La session
+    DB injectée dans kwargs change à chaque requête : on l'ignore.
+    """
+    params = [(name, getattr(kwargs.get(name), "value", kwargs.get(name))) for name in TASKS_LIST_CACHE_PARAMS]
+    return f"{namespace}:list?{urlencode(params)}"
+
+
+def task_cache_key(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """Clé de cache d'une tâche (appel direct, hors requête HTTP)."""
+    return f"{namespace}:task:{kwargs['task_id']}"
+
+
+async def invalidate_tasks_cache():
+    """Vide les lectures en cache après une écriture."""
+    await FastAPICache.clear(namespace="tasks")
+
+
+# =============================================================================
+# PAGINATION
+# =============================================================================
+
+# Pagination par curseur (keyset) : tri par created_at puis id, décroissants.
+# Le curseur encode la position (created_at, id) de la dernière tâche renvoyée ;
+# la page suivante reprend strictement après, sans OFFSET à parcourir et sans
+# dépendre de l'existence de cette tâche (elle peut avoir été supprimée).
+TASKS_PAGE_DEFAULT = 100
+TASKS_PAGE_MAX = 500
+
+
+def encode_cursor(task: TaskModel) -> str:
+    """Curseur opaque : (created_at, id) tels que lus en base, en base64 URL."""
+    return base64.urlsafe_b64encode(orjson.dumps([task.created_at.isoformat(), task.id])).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Position (created_at, id) d'un curseur ; 400 s'il est illisible."""
+    try:
+        created_at, task_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), str(task_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail=f"Invalid cursor {cursor}")
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 
 @app.get("/")
-async def root(db: Session = Depends(get_db)):
+async def root(db: AsyncSession = Depends(get_db)):
     """API root endpoint."""
     return {
         "message": "Welcome to TaskFlow API",
@@ -132,65 +275,132 @@ async def root(db: Session = Depends(get_db)):
 
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_db)):
     """Health check with database status."""
     try:
-        db.execute(text("SELECT 1"))
-        tasks_count = db.query(TaskModel).count()
-        return {
-            "status": "healthy",
-            "database": "connected",
-            "tasks_count": tasks_count
-        }
+        await db.execute(text("SELECT 1"))
+        return {"status": "healthy", "database": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "database": str(e)}
 
 
-@app.get("/tasks", response_model=List[Task])
+# Le comptage parcourt toute la table : on le met en cache quelques secondes
+STATS_TTL_SECONDS = 30
+_stats_cache = {"tasks_count": None, "expires_at": 0.0}
+
+
+@app.get("/stats")
+async def get_stats(db: AsyncSession = Depends(get_db)):
+    """Task statistics, cached for STATS_TTL_SECONDS."""
+    now = time.monotonic()
+    if _stats_cache["tasks_count"] is None or now >= _stats_cache["expires_at"]:
+        _stats_cache["tasks_count"] = await db.scalar(
+            select(func.count()).select_from(TaskModel)
+        )
+        _stats_cache["expires_at"] = now + STATS_TTL_SECONDS
+    return {"tasks_count": _stats_cache["tasks_count"]}
+
+
+# PickleCoder : la réponse entière (en-tête X-Next-Cursor compris) est mise en cache
+@app.get("/tasks", response_model=None, responses={200: {"model": List[Task]}})
+@cache(expire=TASKS_LIST_CACHE_EXPIRE, namespace="tasks", key_builder=tasks_cache_key, coder=PickleCoder)
 async def get_tasks(
     status: Optional[TaskStatus] = None,
     priority: Optional[TaskPriority] = None,
     assignee: Optional[str] = None,
-    db: Session = Depends(get_db)  # ← Toujours en dernier dans les paramètres
+    open_only: bool = False,
+    limit: int = Query(TASKS_PAGE_DEFAULT, ge=1, le=TASKS_PAGE_MAX),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)  # ← Toujours en dernier dans les paramètres
 ):
-    """Get all tasks with optional filtering."""
-    query = db.query(TaskModel)
+    """Get tasks with optional filtering, newest first.
+
+    At most `limit` tasks are returned. When more are available, the
+    X-Next-Cursor response header holds the opaque `cursor` for the next
+    page; a malformed cursor is rejected with a 400.
+    Without a `status` filter, `open_only` excludes done tasks.
+    """
+    # lambda_stmt : le SQL compilé est mis en cache par combinaison de filtres,
+    # seules les valeurs liées (status, cursor, limit...) changent d'un appel à l'autre.
+    # raiseload("*") : tout chargement paresseux de relation lève une erreur
+    # au lieu de déclencher un SELECT par tâche (N+1). Les futures relations
+    # devront être chargées explicitement, ex. .options(selectinload(...)).
+    stmt = lambda_stmt(lambda: select(TaskModel).options(raiseload("*")))
 
     if status:
-        query = query.filter(TaskModel.status == status)
+        stmt += lambda s: s.where(TaskModel.status == status)
+    elif open_only:
+        # Même prédicat (littéral) que l'index partiel ix_tasks_open
+        stmt += lambda s: s.where(OPEN_TASK_CRITERION)
     if priority:
-        query = query.filter(TaskModel.priority == priority)
+        stmt += lambda s: s.where(TaskModel.priority == priority)
     if assignee:
-        query = query.filter(TaskModel.assignee == assignee)
-
-    return query.all()
-
-
-@app.get("/tasks/{task_id}", response_model=Task)
-async def get_task(task_id: str, db: Session = Depends(get_db)):
-    """Get a single task by ID."""
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        stmt += lambda s: s.where(TaskModel.assignee == assignee)
+    params = {}
+    if cursor:
+        params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+        # Comparaison de lignes : borne directe du parcours de ix_tasks_created_at_id.
+        # Paramètres nommés typés par les colonnes (une variable capturée par la
+        # lambda serait liée avec un type DateTime générique).
+        stmt += lambda s: s.where(
+            tuple_(TaskModel.created_at, TaskModel.id) < tuple_(
+                bindparam("cursor_created_at", type_=TaskModel.created_at.type),
+                bindparam("cursor_id", type_=TaskModel.id.type),
+            )
+        )
+
+    # Même sens pour les deux colonnes : parcours inverse de ix_tasks_created_at_id
+    stmt += lambda s: s.order_by(TaskModel.created_at.desc(), TaskModel.id.desc()).limit(limit)
+
+    result = await db.execute(stmt, params)
+    rows = result.scalars().all()
+    # Sérialisation directe : pas de seconde validation via response_model
+    tasks = _TASK_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    response = ORJSONResponse(content=_TASK_LIST_ADAPTER.dump_python(tasks, mode="json"))
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1])
+    return response
+
+
+@cache(expire=TASK_CACHE_EXPIRE, namespace="tasks", key_builder=task_cache_key)
+async def load_task(*, task_id: str, db: AsyncSession) -> dict:
+    """Charge une tâche sérialisée et son ETag (hash du contenu), mis en cache."""
+    task = await db.get(TaskModel, task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-    return task
+    data = dump_task(task)
+    etag = '"' + hashlib.md5(orjson.dumps(data)).hexdigest() + '"'
+    return {"task": data, "etag": etag}
+
 
+@app.get("/tasks/{task_id}", response_model=None, responses={200: {"model": Task}})
+async def get_task(task_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    """Get a single task by ID.
 
-@app.post("/tasks", response_model=Task, status_code=201)
-async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)) -> Task:
+    Supports conditional requests: a matching If-None-Match header gets a
+    304 Not Modified without a body.
+    """
+    cached = await load_task(task_id=task_id, db=db)
+    etag = cached["etag"]
+    # Comparaison faible (RFC 9110) : W/"x" correspond à "x" (ETag affaibli par un proxy gzip)
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(content=cached["task"], headers={"ETag": etag})
+
+
+@app.post("/tasks", response_model=None, status_code=201, responses={201: {"model": Task}})
+async def create_task(task_data: TaskCreate, db: AsyncSession = Depends(get_db)) -> ORJSONResponse:
     # 1. Validation du titre
     if not task_data.title or not task_data.title.strip():
         raise HTTPException(status_code=422, detail="Le titre ne peut pas être vide.")
 
-    # 2. Création de l'objet TaskModel (SQLAlchemy)
-    
-    # Nous utilisons 'uuid.uuid4()' pour générer un ID unique,
-    # et 'datetime.now(timezone.utc)' pour un horodatage précis.
-    task_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc)
+    # 2. Préparation de l'INSERT (SQLAlchemy)
     
-    # Map des données Pydantic à l'objet SQLAlchemy TaskModel
-    db_task = TaskModel(
-        id=task_id, # Utilisation de l'UUID généré
+    # L'ID (UUID) et les horodatages (created_at, updated_at) sont générés
+    # par la base via les valeurs par défaut des colonnes.
+    values = dict(
         title=task_data.title,
         description=task_data.description,
         status=task_data.status,
@@ -198,109 +408,93 @@ async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)) -> T
         assignee=task_data.assignee,
         due_date=task_data.due_date
     )
+    if database.legacy_task_id:
+        # Ancienne table SQLite sans DEFAULT pour id (voir init_db)
+        values["id"] = str(uuid.uuid4())
+    
+    # Map des données Pydantic vers un INSERT ... RETURNING : la ligne créée
+    # (valeurs par défaut DB incluses) revient en un seul aller-retour,
+    # sans SELECT supplémentaire via db.refresh().
+    stmt = insert(TaskModel).values(**values).returning(TaskModel)
     
     # 3. Opérations sur la base de données
-    db.add(db_task)
     try:
-        db.commit() # Tente d'écrire la tâche dans la base de données
+        db_task = await db.scalar(stmt)
+        await db.commit() # Tente d'écrire la tâche dans la base de données
     except Exception as e:
-        db.rollback() # Annule les changements en cas d'erreur
-        # Vous pourriez vouloir logguer l'erreur ici : logger.error(f"DB Error: {e}")
+        await db.rollback() # Annule les changements en cas d'erreur
+        logger.error("DB Error: %s", e)
         raise HTTPException(status_code=500, detail="Erreur lors de la sauvegarde de la tâche dans la base de données.")
 
-    db.refresh(db_task) # Récupère la tâche fraîchement créée (incluant les valeurs par défaut DB si elles existent)
+    await invalidate_tasks_cache()
 
     # 4. Enregistrement (Logging) et Retour
     
     # Ligne originale non nécessaire si on utilise uniquement la DB: tasks_db[task_id] = task
     # Ligne de log
-    # logger.info(f"Task created successfully: {task_id}") 
+    logger.info("Task created successfully: %s", db_task.id)
     
-    # Construction du modèle de retour Pydantic (Task) à partir de l'objet SQLAlchemy (db_task)
-    return db_task 
-    # ou Task(**db_task.__dict__) si Task.from_orm n'est pas configuré
+    # Construction de la réponse à partir de l'objet SQLAlchemy (db_task),
+    # sans seconde validation via response_model
+    return ORJSONResponse(content=dump_task(db_task), status_code=201)
 
 
-@app.put("/tasks/{task_id}", response_model=Task)
-async def update_task(task_id: int, updates: TaskUpdate,db: Session = Depends(get_db)) -> Task:
+@app.put("/tasks/{task_id}", response_model=None, responses={200: {"model": Task}})
+async def update_task(task_id: str, updates: TaskUpdate, db: AsyncSession = Depends(get_db)) -> ORJSONResponse:
     """
     Update an existing task (partial update supported).
 
-    TODO (Atelier 1 - Exercice 2): Implémenter cette fonction
-
-    Étapes à suivre:
-    1. Vérifier que la tâche existe dans tasks_db
-       - Si elle n'existe pas, lever HTTPException(status_code=404, detail=f"Task {task_id} not found")
-
-    2. Récupérer la tâche existante
-
-    3. Extraire les champs à mettre à jour avec updates.model_dump(exclude_unset=True)
-
-    4. Valider le titre s'il est fourni (ne doit pas être vide)
-       - Si vide, lever HTTPException(status_code=422, detail="Title cannot be empty")
-
-    5. Créer une nouvelle Task avec:
-       - Les champs mis à jour (utiliser update_data.get("field", existing_task.field))
-       - created_at = existing_task.created_at (ne change pas)
-       - updated_at = datetime.utcnow() (nouvelle date)
-
-    6. Mettre à jour tasks_db[task_id]
-
-    7. Retourner la tâche mise à jour
-
-    Indice: Regardez comment create_task fonctionne pour vous inspirer
+    Un seul UPDATE ... RETURNING : pas de SELECT préalable ni de refresh.
+    updated_at est mis à jour par la base (onupdate de la colonne).
     """
-    tasks_db = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-    
-    if tasks_db is None:
-        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-    # TODO: Votre code ici
-    if task_id not in tasks_db:
-        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-    
-    existing_task = tasks_db[task_id]
     update_data = updates.model_dump(exclude_unset=True)
 
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    if not existing_task.title or not existing_task.title.strip():
+    if "title" in update_data and not (update_data["title"] or "").strip():
         raise HTTPException(status_code=422, detail="Title cannot be empty")
-    
-    task = Task(
-        id=update_data.get("id",existing_task.id),
-        title=update_data.get("title",existing_task.title),
-        description=update_data.get("description",existing_task.description),
-        status=update_data.get("status",existing_task.status),
-        priority=update_data.get("priority",existing_task.priority),
-        assignee=update_data.get("assignee",existing_task.assignee),
-        due_date=update_data.get("due_date",existing_task.due_date),
-        created_at=existing_task.created_at,
-        updated_at=datetime.utcnow(),   
+    # null explicite refusé pour les champs obligatoires de Task
+    for field in ("status", "priority"):
+        if field in update_data and update_data[field] is None:
+            raise HTTPException(status_code=422, detail=f"{field.capitalize()} cannot be null")
+
+    stmt = (
+        update(TaskModel)
+        .where(TaskModel.id == task_id)
+        .values(**update_data)
+        .returning(TaskModel)
     )
+    task = await db.scalar(stmt)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await invalidate_tasks_cache()
+
+    logger.info("Task updated successfully: %s", task_id)
+    return ORJSONResponse(content=dump_task(task))
 
-    tasks_db[task_id] = task
-    logger.info(f"Task updated successfully: {task_id}")
-    return task
-    
 
 @app.delete("/tasks/{task_id}", status_code=204)
-async def delete_task(task_id: str, db: Session = Depends(get_db)):
+async def delete_task(task_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a task by ID."""
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    task = await db.get(TaskModel, task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await db.commit()
+    await invalidate_tasks_cache()
 
-    logger.info(f"Task deleted successfully: {task_id}")
+    logger.info("Task deleted successfully: %s", task_id)
     return None
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop et httptools sont choisis automatiquement s'ils sont installés.
+    # Un seul worker par défaut : le cache /tasks est propre à chaque processus.
+    uvicorn.run(
+        "src.app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
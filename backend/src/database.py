@@ -1,43 +1,94 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 # Lire l'URL de la base de données depuis les variables d'environnement
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./taskflow.db")
 
+
+def to_async_url(url: str) -> str:
+    """Remplace le driver synchrone de l'URL par son équivalent asynchrone."""
+    if url.startswith("postgres://"):
+        # Certains hébergeurs (Render, Heroku) fournissent encore l'ancien schéma
+        url = "postgresql://" + url[len("postgres://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
 # Configuration du moteur SQLAlchemy
-if DATABASE_URL.startswith("sqlite"):
+if ASYNC_DATABASE_URL.startswith("sqlite"):
     # SQLite (développement local)
-    engine = create_engine(
-        DATABASE_URL,
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL,
         connect_args={"check_same_thread": False}
     )
 else:
     # PostgreSQL (production)
-    engine = create_engine(
-        DATABASE_URL,
-        pool_size=5,
-        max_overflow=10,
+    # Pool de connexions persistant : évite un handshake TCP/TLS par requête.
+    # pool_size * nombre de workers doit rester sous max_connections de Postgres.
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
         pool_pre_ping=True
     )
 
 # Factory de sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Base pour les modèles ORM
 Base = declarative_base()
 
 
-def get_db():
-    """Générateur qui fournit une session de base de données."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Générateur asynchrone qui fournit une session de base de données.
+
+    Une AsyncSession n'accepte pas de requêtes concurrentes : pour lancer des
+    requêtes indépendantes avec asyncio.gather, ouvrir une session par requête
+    via SessionLocal().
+    """
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+# Vrai si la table tasks existante n'a pas de DEFAULT en base pour id et qu'il
+# ne peut pas être ajouté (SQLite) : l'application génère alors l'id elle-même.
+legacy_task_id = False
+
+
+def ensure_task_id_default(conn) -> bool:
+    """Garantit le DEFAULT en base de tasks.id sur une table déjà existante.
+
+    create_all ne modifie pas les tables existantes : PostgreSQL reçoit un
+    ALTER TABLE (idempotent), SQLite ne le permet pas. Renvoie False si la
+    colonne reste sans DEFAULT.
+    """
+    columns = {column["name"]: column for column in inspect(conn).get_columns("tasks")}
+    if columns["id"]["default"] is not None:
+        return True
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE tasks ALTER COLUMN id SET DEFAULT gen_random_uuid()::text"))
+        return True
+    return False
+
+
+async def init_db():
     """Initialise la base de données en créant toutes les tables."""
+    global legacy_task_id
     from . import models  # Import des modèles pour créer les tables
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        legacy_task_id = not await conn.run_sync(ensure_task_id_default)
@@ -1,10 +1,46 @@
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Index, literal
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import FunctionElement
 
 from .database import Base
 
 
+class gen_random_uuid(FunctionElement):
+    """UUID v4 (texte) généré par la base, compilé selon le dialecte."""
+    type = String()
+    inherit_cache = True
+
+
+@compiles(gen_random_uuid, "postgresql")
+def _pg_gen_random_uuid(element, compiler, **kw):
+    return "gen_random_uuid()::text"
+
+
+@compiles(gen_random_uuid, "sqlite")
+def _sqlite_gen_random_uuid(element, compiler, **kw):
+    # SQLite n'a pas de fonction UUID : on assemble un v4 depuis randomblob()
+    return (
+        "(lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6))))"
+    )
+
+
+# Horodatage rempli par la base (func.now()). Sous SQLite, CURRENT_TIMESTAMP stocke
+# un texte à la seconde : les valeurs liées utilisent le même format, sinon la
+# comparaison de textes "…:00" < "…:00.000000" fausse le curseur de pagination.
+ServerTimestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+
 class TaskStatus(str, Enum):
     """Statuts possibles d'une tâche."""
     TODO = "todo"
@@ -22,13 +58,40 @@ class TaskPriority(str, Enum):
 class TaskModel(Base):
     """Modèle SQLAlchemy pour la table tasks."""
     __tablename__ = "tasks"
+    # Index sur les colonnes filtrées par GET /tasks
+    __table_args__ = (
+        Index("ix_tasks_status", "status"),
+        Index("ix_tasks_priority", "priority"),
+        Index("ix_tasks_assignee_status", "assignee", "status"),
+        # Pagination keyset de GET /tasks (ORDER BY created_at DESC, id DESC)
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+    )
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True, index=True, server_default=gen_random_uuid())
     title = Column(String(200), nullable=False)
     description = Column(String(1000), nullable=True)
     status = Column(SQLEnum(TaskStatus), default=TaskStatus.TODO)
     priority = Column(SQLEnum(TaskPriority), default=TaskPriority.MEDIUM)
     assignee = Column(String(100), nullable=True)
     due_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    created_at = Column(ServerTimestamp, server_default=func.now())
+    updated_at = Column(ServerTimestamp, server_default=func.now(), onupdate=func.now())
+
+
+# Prédicat « tâche ouverte », partagé par l'index partiel et GET /tasks?open_only.
+# Valeur rendue en littéral dans le SQL (pas un paramètre lié) : avec des requêtes
+# préparées (asyncpg), PostgreSQL ne peut prouver qu'un plan générique satisfait
+# le prédicat de l'index que si la requête contient exactement ce littéral.
+OPEN_TASK_CRITERION = TaskModel.status != literal(
+    TaskStatus.DONE, TaskModel.status.type, literal_execute=True
+)
+
+# Index partiel sur les tâches ouvertes (ensemble de travail des tableaux de bord) :
+# sa taille suit le nombre de tâches non terminées, pas l'historique complet.
+Index(
+    "ix_tasks_open",
+    TaskModel.priority,
+    TaskModel.assignee,
+    postgresql_where=OPEN_TASK_CRITERION,
+    sqlite_where=OPEN_TASK_CRITERION,
+)
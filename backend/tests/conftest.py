@@ -1,12 +1,16 @@
+import asyncio
 import pytest
 import tempfile
+from fastapi_cache import FastAPICache
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 
-from src.app import app
-from src.database import Base, get_db
+from src.app import app, invalidate_tasks_cache
+from src import database
+from src.database import Base, get_db, to_async_url
 from src.models import TaskModel
 
 TEST_DB_FILE = tempfile.mktemp(suffix=".db")
@@ -20,6 +24,21 @@ test_engine = create_engine(
 
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+# Moteur asynchrone utilisé par l'application pendant les tests.
+# NullPool : chaque session ouvre sa propre connexion sur la boucle courante.
+test_async_engine = create_async_engine(
+    to_async_url(TEST_DATABASE_URL),
+    connect_args={"check_same_thread": False},
+    poolclass=NullPool,
+)
+
+TestAsyncSessionLocal = async_sessionmaker(
+    bind=test_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 @pytest.fixture(scope="session")
 def setup_test_database():
@@ -36,17 +55,28 @@ def clear_test_data(setup_test_database):
     db.query(TaskModel).delete()
     db.commit()
     db.close()
+    # Le cache survit au TestClient : on repart d'un cache vide à chaque test
+    if FastAPICache._backend is not None:
+        asyncio.run(invalidate_tasks_cache())
 
 
 @pytest.fixture
-def client(setup_test_database):
+def db_session(setup_test_database):
+    """Session synchrone pour modifier la base sans passer par l'API."""
+    db = TestSessionLocal()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def client(setup_test_database, monkeypatch):
     """Client de test avec base de données isolée."""
-    def override_get_db():
-        db = TestSessionLocal()
-        try:
+    # init_db (lifespan) inspecte la base de test, pas ./taskflow.db
+    monkeypatch.setattr(database, "engine", test_async_engine)
+
+    async def override_get_db():
+        async with TestAsyncSessionLocal() as db:
             yield db
-        finally:
-            db.close()
 
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
@@ -9,6 +9,8 @@ Structure de chaque test :
 3. ASSERT - Vérifier la réponse
 """
 
+import uuid
+
 import pytest
 
 
@@ -37,7 +39,33 @@ def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"  # ✅ Correct
+    assert "tasks_count" not in response.json()
+
+
+def test_stats_counts_tasks(client):
+    """/stats expose le nombre de tâches (mis en cache)."""
+    from src.app import _stats_cache
+    _stats_cache["tasks_count"] = None  # Vide le cache
+
+    client.post("/tasks", json={"title": "Tâche 1"})
+    client.post("/tasks", json={"title": "Tâche 2"})
+
+    response = client.get("/stats")
+    assert response.status_code == 200
+    assert response.json()["tasks_count"] == 2
         
+def test_cors_preflight(client):
+    """Le preflight CORS accepte l'origine du frontend et les méthodes utilisées."""
+    response = client.options("/tasks", headers={
+        "Origin": "http://localhost:5173",
+        "Access-Control-Request-Method": "PUT",
+        "Access-Control-Request-Headers": "Content-Type",
+    })
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    assert "PUT" in response.headers["access-control-allow-methods"]
+
+
 def test_create_task(client):
     """
     EXEMPLE : Tester un point de terminaison POST (création de données).
@@ -65,6 +93,31 @@ def test_create_task(client):
     assert task["description"] == "Lait, œufs, pain"
     assert task["status"] == "todo"  # Valeur par défaut
     assert "id" in task  # Le serveur génère un ID
+    assert uuid.UUID(task["id"]).version == 4  # UUID généré par la base
+
+    from src import database
+    assert database.legacy_task_id is False  # DEFAULT en base présent
+
+
+def test_ensure_task_id_default_on_legacy_table():
+    """Une table SQLite créée avant le DEFAULT de tasks.id est détectée."""
+    from sqlalchemy import create_engine, text
+    from src.database import ensure_task_id_default
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE tasks (id VARCHAR NOT NULL PRIMARY KEY)"))
+        assert ensure_task_id_default(conn) is False
+
+
+def test_create_task_on_legacy_table(client, monkeypatch):
+    """Sans DEFAULT en base, l'application fournit elle-même l'UUID."""
+    from src import database
+    monkeypatch.setattr(database, "legacy_task_id", True)
+
+    response = client.post("/tasks", json={"title": "Ancienne table"})
+    assert response.status_code == 201
+    assert uuid.UUID(response.json()["id"]).version == 4
 
 
 def test_list_tasks(client):
@@ -107,6 +160,28 @@ def test_get_task_by_id(client):
     assert response.json()["title"] == "Trouve-moi"
 
 
+def test_get_task_etag_not_modified(client):
+    """Un client qui renvoie l'ETag reçu obtient 304 tant que la tâche n'a pas changé."""
+    task_id = client.post("/tasks", json={"title": "Version 1"}).json()["id"]
+
+    response = client.get(f"/tasks/{task_id}")
+    etag = response.headers["ETag"]
+
+    response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Comparaison faible : un ETag affaibli par un proxy correspond toujours
+    response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+
+    client.put(f"/tasks/{task_id}", json={"title": "Version 2"})
+    response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Version 2"
+    assert response.headers["ETag"] != etag
+
+
 # =============================================================================
 # PARTIE 2 : À VOUS ! Complétez ces tests
 # =============================================================================
@@ -134,6 +209,27 @@ def test_delete_task(client):
     assert response.status_code == 204
 
 
+def test_reads_served_from_cache_until_write(client, db_session):
+    """Les lectures sont servies depuis le cache jusqu'à la prochaine écriture via l'API."""
+    from src.models import TaskModel
+
+    task_id = client.post("/tasks", json={"title": "En cache"}).json()["id"]
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "En cache"
+    assert client.get("/tasks").json()[0]["title"] == "En cache"
+
+    # Modification directe en base, sans passer par l'API : le cache n'est pas invalidé
+    db_session.query(TaskModel).filter(TaskModel.id == task_id).update({"title": "Modifié en base"})
+    db_session.commit()
+
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "En cache"
+    assert client.get("/tasks").json()[0]["title"] == "En cache"
+
+    # Une écriture via l'API invalide le cache
+    client.delete(f"/tasks/{task_id}")
+    assert client.get(f"/tasks/{task_id}").status_code == 404
+    assert client.get("/tasks").json() == []
+
+
 def test_delete_nonexistent_task_returns_404(client):
     """Deleting a task that doesn't exist should return 404."""
     # TODO: Votre code ici
@@ -147,7 +243,7 @@ def test_delete_nonexistent_task_returns_404(client):
     assert "not found" in response.json()["detail"]
 
 
-"""def test_update_task(client):
+def test_update_task(client):
     # TODO : Écrivez votre test ici !
     create_response = client.post("/tasks", json={"title": "Titre Original"})
     task_id = create_response.json()["id"]
@@ -155,7 +251,39 @@ def test_delete_nonexistent_task_returns_404(client):
     response = client.put(f"/tasks/{task_id}", json={"title": "Nouveau Titre"})
     assert response.status_code == 200
     assert response.json()["title"] == "Nouveau Titre"
-"""
+
+    # La lecture suivante voit la mise à jour (cache invalidé)
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "Nouveau Titre"
+
+
+def test_update_task_null_status_rejected(client):
+    """Un status null est refusé avant d'écrire en base : la liste reste lisible."""
+    task_id = client.post("/tasks", json={"title": "Tâche"}).json()["id"]
+
+    response = client.put(f"/tasks/{task_id}", json={"status": None})
+    assert response.status_code == 422
+
+    assert client.get(f"/tasks/{task_id}").json()["status"] == "todo"
+    assert client.get("/tasks").status_code == 200
+
+
+def test_due_date_with_timezone_stored_as_utc(client):
+    """Une due_date avec fuseau est ramenée en UTC naïf (colonne sans fuseau)."""
+    response = client.post("/tasks", json={"title": "Tâche", "due_date": "2025-01-01T00:00:00Z"})
+    assert response.status_code == 201
+    task = response.json()
+    assert task["due_date"] == "2025-01-01T00:00:00"
+
+    response = client.put(f"/tasks/{task['id']}", json={"due_date": "2025-01-01T02:00:00+02:00"})
+    assert response.status_code == 200
+    assert response.json()["due_date"] == "2025-01-01T00:00:00"
+    assert client.get(f"/tasks/{task['id']}").json()["due_date"] == "2025-01-01T00:00:00"
+
+
+def test_update_nonexistent_task_returns_404(client):
+    response = client.put("/tasks/inexistante", json={"title": "Nouveau Titre"})
+    assert response.status_code == 404
+    assert "not found" in response.json()["detail"]
 
 # EXERCICE 3 : Tester la validation - un titre vide devrait échouer
 def test_create_task_empty_title(client):
@@ -250,6 +378,106 @@ def test_filter_by_multiple_criteria(client):
     assert tasks[0]["priority"] == "high"
 
 
+def test_filter_values_change_between_requests(client):
+    """La requête SQL mise en cache ne doit pas figer les valeurs des filtres."""
+    client.post("/tasks", json={"title": "A faire", "status": "todo"})
+    client.post("/tasks", json={"title": "Terminée", "status": "done"})
+
+    todo = client.get("/tasks", params={"status": "todo"}).json()
+    done = client.get("/tasks", params={"status": "done"}).json()
+
+    assert [task["title"] for task in todo] == ["A faire"]
+    assert [task["title"] for task in done] == ["Terminée"]
+
+
+def test_list_open_tasks_only(client):
+    """open_only=true exclut les tâches terminées."""
+    client.post("/tasks", json={"title": "A faire", "status": "todo"})
+    client.post("/tasks", json={"title": "En cours", "status": "in_progress"})
+    client.post("/tasks", json={"title": "Terminée", "status": "done"})
+
+    response = client.get("/tasks", params={"open_only": True})
+    assert response.status_code == 200
+    assert {task["status"] for task in response.json()} == {"todo", "in_progress"}
+
+    assert len(client.get("/tasks").json()) == 3
+
+
+def test_list_cache_key_escapes_values(client):
+    """Une valeur contenant '&' ou '=' ne doit pas réutiliser le cache d'une autre requête."""
+    client.post("/tasks", json={"title": "Terminée", "assignee": "x", "status": "done"})
+
+    assert len(client.get("/tasks?assignee=x&status=done").json()) == 1
+    assert client.get("/tasks?assignee=x%26status%3Ddone").json() == []
+
+
+def test_cache_backend_is_bounded():
+    """Le cache garde au plus max_entries clés et évince la moins récemment lue."""
+    import asyncio
+    from src.app import BoundedMemoryBackend
+
+    async def scenario():
+        backend = BoundedMemoryBackend(max_entries=2)
+        await backend.set("a", b"1", expire=60)
+        await backend.set("b", b"2", expire=60)
+        assert await backend.get("a") == b"1"  # "a" devient la plus récente
+        await backend.set("c", b"3", expire=60)
+        return backend
+
+    backend = asyncio.run(scenario())
+    assert list(backend._store) == ["a", "c"]
+
+
+def test_open_task_criterion_is_literal():
+    """Le prédicat open_only est un littéral, identique à celui de l'index partiel."""
+    from sqlalchemy import select
+    from sqlalchemy.dialects.postgresql import asyncpg
+    from src.models import OPEN_TASK_CRITERION, TaskModel
+
+    sql = str(select(TaskModel.id).where(OPEN_TASK_CRITERION).compile(
+        dialect=asyncpg.dialect(), compile_kwargs={"render_postcompile": True}
+    ))
+    assert "status != 'DONE'" in sql
+
+
+def test_list_tasks_pagination(client):
+    """La liste est paginée : le curseur de X-Next-Cursor donne la page suivante."""
+    for i in range(3):
+        client.post("/tasks", json={"title": f"Tâche {i}"})
+
+    first_page = client.get("/tasks", params={"limit": 2})
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get("/tasks", params={"limit": 2, "cursor": cursor})
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
+
+    ids = {task["id"] for task in first_page.json() + second_page.json()}
+    assert len(ids) == 3
+
+
+def test_list_tasks_cursor_survives_deleted_task(client):
+    """Supprimer la dernière tâche d'une page ne casse pas la page suivante."""
+    for i in range(3):
+        client.post("/tasks", json={"title": f"Tâche {i}"})
+
+    first_page = client.get("/tasks", params={"limit": 2})
+    cursor = first_page.headers["X-Next-Cursor"]
+    client.delete(f"/tasks/{first_page.json()[-1]['id']}")
+
+    second_page = client.get("/tasks", params={"limit": 2, "cursor": cursor})
+    assert second_page.status_code == 200
+    assert len(second_page.json()) == 1
+    assert second_page.json()[0]["id"] not in {task["id"] for task in first_page.json()}
+
+
+def test_list_tasks_invalid_cursor(client):
+    response = client.get("/tasks", params={"cursor": "inexistant"})
+    assert response.status_code == 400
+
+
 # =============================================================================
 # EXERCICES BONUS (Si vous finissez en avance !)
 # =============================================================================
@@ -18,6 +18,7 @@ describe('API Module', () => {
     (globalThis as any).fetch = vi.fn(() =>
       Promise.resolve({
         ok: true,
+        headers: new Headers(),
         json: () => Promise.resolve([
           { id: 1, title: 'Test Task', status: 'todo' }
         ]),
@@ -30,6 +31,31 @@ describe('API Module', () => {
     expect(tasks[0].title).toBe('Test Task');
   });
 
+  /**
+   * Le backend pagine /tasks : getTasks suit l'en-tête X-Next-Cursor
+   * jusqu'à la dernière page et renvoie toutes les tâches.
+   */
+  it('follows the pagination cursor', async () => {
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce({
+        ok: true,
+        headers: new Headers({ 'X-Next-Cursor': 'abc' }),
+        json: () => Promise.resolve([{ id: 1, title: 'Page 1', status: 'todo' }]),
+      })
+      .mockResolvedValueOnce({
+        ok: true,
+        headers: new Headers(),
+        json: () => Promise.resolve([{ id: 2, title: 'Page 2', status: 'todo' }]),
+      });
+    (globalThis as any).fetch = fetchMock;
+
+    const tasks = await api.getTasks();
+
+    expect(tasks.map((t) => t.title)).toEqual(['Page 1', 'Page 2']);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(fetchMock.mock.calls[1][0]).toContain('cursor=abc');
+  });
+
   /**
    * Test 2 : Vérifier que l'API peut créer des tâches
    * Montre comment tester les requêtes POST